@@ -4,9 +4,27 @@ Admin Functionality Testing for Simplified Jira Application
 Tests Group CRUD, Board Creation, Board Visibility Settings, and Department Users Lookup
 """
 import requests
+from requests.adapters import HTTPAdapter
+import os
 import sys
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from collections import defaultdict
 from datetime import datetime
+from pathlib import Path
+
+# (connect, read) seconds so an unresponsive server fails fast instead of hanging each call
+REQUEST_TIMEOUT = (3.05, 10)
+
+# Buffered log lines are written out in batches of this size
+LOG_FLUSH_LINES = 64
+
+# CEO token reused between runs; tokens are treated as valid for TOKEN_CACHE_TTL seconds
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "taskmanager_ceo_token.json"
+TOKEN_CACHE_TTL = 3000
 
 class AdminFunctionalityTester:
     def __init__(self, base_url="https://projectflow-37.preview.emergentagent.com"):
@@ -21,52 +39,75 @@ class AdminFunctionalityTester:
             'boards': [],
             'departments': []
         }
+        self.cache = {}
+        self.lock = threading.Lock()
+        self.log_lock = threading.Lock()
+        self.log_buffer = []
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
 
     def log(self, message):
         """Log test messages"""
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        line = f"[{time.strftime('%H:%M:%S')}] {message}"
+        with self.log_lock:
+            self.log_buffer.append(line)
+            if len(self.log_buffer) >= LOG_FLUSH_LINES:
+                self._write_log_buffer()
+
+    def flush_log(self):
+        """Write out any buffered log lines"""
+        with self.log_lock:
+            self._write_log_buffer()
+
+    def _write_log_buffer(self):
+        if self.log_buffer:
+            sys.stdout.write("\n".join(self.log_buffer) + "\n")
+            sys.stdout.flush()
+            self.log_buffer.clear()
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
-        """Run a single API test"""
+    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, parse_json=True):
+        """Run a single API test; pass parse_json=False when only the status matters"""
         url = f"{self.api_base}{endpoint}"
-        test_headers = {'Content-Type': 'application/json'}
         
-        if self.ceo_token:
-            test_headers['Authorization'] = f'Bearer {self.ceo_token}'
-        elif headers:
-            test_headers.update(headers)
-
-        self.tests_run += 1
+        with self.lock:
+            self.tests_run += 1
         self.log(f"🔍 Testing {name}...")
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'PATCH':
-                response = requests.patch(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=30)
+            # Stream so bodies are only read when they are actually needed
+            response = self.session.request(
+                method, url, json=data, headers=headers, timeout=REQUEST_TIMEOUT, stream=True
+            )
 
             success = response.status_code == expected_status
             if success:
-                self.tests_passed += 1
+                with self.lock:
+                    self.tests_passed += 1
                 self.log(f"✅ {name} - Status: {response.status_code}")
+                if not parse_json:
+                    self._discard_body(response)
+                    return True, None
+                if not response.headers.get('Content-Type', '').startswith('application/json'):
+                    self._discard_body(response)
+                    return True, {}
                 try:
                     return True, response.json() if response.content else {}
                 except:
                     return True, {}
             else:
+                # Read only the first 300 bytes instead of decoding the whole body
+                snippet = response.raw.read(300, decode_content=True).decode('utf-8', errors='replace')
+                response.close()
                 self.log(f"❌ {name} - Expected {expected_status}, got {response.status_code}")
-                self.log(f"   Response: {response.text[:300]}")
+                self.log(f"   Response: {snippet}")
                 self.failed_tests.append({
                     "test": name,
                     "expected": expected_status,
                     "actual": response.status_code,
-                    "response": response.text[:300]
+                    "response": snippet
                 })
                 return False, {}
 
@@ -78,10 +119,73 @@ class AdminFunctionalityTester:
             })
             return False, {}
 
+    def _discard_body(self, response):
+        """Drain a streamed body without keeping it so the connection returns to the pool"""
+        for _ in response.iter_content(chunk_size=8192):
+            pass
+        response.close()
+
+    def cached_get(self, name, endpoint):
+        """Run a GET test once per endpoint and reuse the response for the rest of the run"""
+        if endpoint in self.cache:
+            return True, self.cache[endpoint]
+        
+        success, response = self.run_test(name, "GET", endpoint, 200)
+        if success:
+            self.cache[endpoint] = response
+        return success, response
+
+    def run_concurrently(self, func, calls, max_workers=8):
+        """Run independent calls of func over the shared session, returning results in order"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda args: func(*args), calls))
+
+    def load_cached_token(self):
+        """Return a still-valid cached CEO token for this server, if any"""
+        try:
+            cached = json.loads(TOKEN_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return None
+        
+        if cached.get('base_url') != self.base_url or cached.get('exp', 0) <= time.time() + 60:
+            return None
+        return cached.get('token')
+
+    def save_cached_token(self, token):
+        """Persist the CEO token (owner-readable only) for the next run"""
+        try:
+            TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({"base_url": self.base_url, "token": token, "exp": time.time() + TOKEN_CACHE_TTL}, f)
+        except OSError as e:
+            self.log(f"   ⚠️ Could not cache CEO token: {e}")
+
     def authenticate_ceo(self):
         """Authenticate as CEO for admin access"""
         self.log("\n🔐 Authenticating as CEO...")
         
+        # Reuse the token from a previous run if the server still accepts it
+        cached_token = self.load_cached_token()
+        if cached_token:
+            try:
+                response = self.session.get(
+                    f"{self.api_base}/auth/me",
+                    headers={'Authorization': f'Bearer {cached_token}'},
+                    timeout=REQUEST_TIMEOUT
+                )
+            except requests.RequestException:
+                response = None
+            
+            if response is not None and response.status_code == 200:
+                self.ceo_token = cached_token
+                self.session.headers['Authorization'] = f'Bearer {self.ceo_token}'
+                self.log("   ✓ Reusing cached CEO token")
+                self.log(f"   → CEO: {response.json().get('full_name', 'N/A')}")
+                return True
+            
+            TOKEN_CACHE_PATH.unlink(missing_ok=True)
+        
         success, response = self.run_test(
             "CEO Login",
             "POST",
@@ -92,6 +196,8 @@ class AdminFunctionalityTester:
         
         if success and 'access_token' in response:
             self.ceo_token = response['access_token']
+            self.session.headers['Authorization'] = f'Bearer {self.ceo_token}'
+            self.save_cached_token(self.ceo_token)
             self.log(f"   ✓ CEO authenticated successfully")
             self.log(f"   → CEO: {response['user']['full_name']}")
             return True
@@ -102,14 +208,10 @@ class AdminFunctionalityTester:
     def test_group_crud_operations(self):
         """Test Group CRUD Operations"""
         self.log("\n👥 Testing Group CRUD Operations...")
+        stamp = datetime.now().strftime('%H%M%S')
         
         # First, get existing groups to understand the structure
-        success, response = self.run_test(
-            "Get existing groups",
-            "GET",
-            "/admin/groups",
-            200
-        )
+        success, response = self.cached_get("Get existing groups", "/admin/groups")
         
         existing_groups = []
         if success:
@@ -119,12 +221,7 @@ class AdminFunctionalityTester:
                 self.log(f"   → Group: {group.get('name', 'N/A')} (ID: {group.get('id', 'N/A')})")
         
         # Get departments for group creation
-        success, response = self.run_test(
-            "Get departments for group creation",
-            "GET",
-            "/admin/departments",
-            200
-        )
+        success, response = self.cached_get("Get departments for group creation", "/admin/departments")
         
         departments = []
         if success:
@@ -137,7 +234,7 @@ class AdminFunctionalityTester:
         
         # Test 1: Create new group
         test_group_data = {
-            "name": f"Test Admin Group {datetime.now().strftime('%H%M%S')}",
+            "name": f"Test Admin Group {stamp}",
             "department_id": departments[0]['id'],
             "lead_user_id": None,
             "member_ids": []
@@ -151,6 +248,9 @@ class AdminFunctionalityTester:
             data=test_group_data
         )
         
+        # Group mutations make the cached group list stale
+        self.cache.pop("/admin/groups", None)
+        
         created_group_id = None
         if success and 'id' in response:
             created_group_id = response['id']
@@ -162,7 +262,7 @@ class AdminFunctionalityTester:
         # Test 2: Update group (PUT /api/admin/groups/{group_id})
         if created_group_id:
             updated_group_data = {
-                "name": f"Updated Test Group {datetime.now().strftime('%H%M%S')}",
+                "name": f"Updated Test Group {stamp}",
                 "department_id": departments[0]['id'],
                 "lead_user_id": None,
                 "member_ids": []
@@ -181,12 +281,7 @@ class AdminFunctionalityTester:
                 self.log(f"   → New name: {response.get('name', 'N/A')}")
             
             # Test updating with members (if we have users)
-            success, users_response = self.run_test(
-                "Get users for group member test",
-                "GET",
-                "/users",
-                200
-            )
+            success, users_response = self.cached_get("Get users for group member test", "/users")
             
             if success and users_response:
                 # Add first user as member
@@ -221,6 +316,7 @@ class AdminFunctionalityTester:
                 200
             )
             
+            self.cache.pop("/admin/groups", None)
             if success:
                 self.log(f"   ✓ Deleted group successfully")
                 self.log(f"   → Response: {response.get('message', 'N/A')}")
@@ -252,7 +348,8 @@ class AdminFunctionalityTester:
             "POST",
             "/admin/groups",
             400,
-            data=invalid_group_data
+            data=invalid_group_data,
+            parse_json=False
         )
         
         return True
@@ -260,37 +357,31 @@ class AdminFunctionalityTester:
     def test_board_creation(self):
         """Test Board Creation with visibility settings"""
         self.log("\n📋 Testing Board Creation...")
+        stamp = datetime.now().strftime('%H%M%S')
         
         # Get departments and groups for board creation
-        success, departments_response = self.run_test(
-            "Get departments for board creation",
-            "GET",
-            "/admin/departments",
-            200
+        results = self.run_concurrently(
+            self.cached_get,
+            [
+                ("Get departments for board creation", "/admin/departments"),
+                ("Get groups for board creation", "/admin/groups"),
+                ("Get users for board creation", "/users"),
+            ]
         )
         
-        success, groups_response = self.run_test(
-            "Get groups for board creation",
-            "GET",
-            "/admin/groups",
-            200
-        )
-        
-        success, users_response = self.run_test(
-            "Get users for board creation",
-            "GET",
-            "/users",
-            200
-        )
+        if not all(success for success, _ in results):
+            self.log("   ❌ Preparation lookups failed - skipping board creation tests")
+            return False
         
+        (_, departments_response), (_, groups_response), (_, users_response) = results
         departments = departments_response if departments_response else []
         groups = groups_response if groups_response else []
         users = users_response if users_response else []
         
         # Test 1: Create board with users mode visibility
         board_data_users = {
-            "name": f"Test Board Users Mode {datetime.now().strftime('%H%M%S')}",
-            "key": f"TEST_USERS_{datetime.now().strftime('%H%M%S')}",
+            "name": f"Test Board Users Mode {stamp}",
+            "key": f"TEST_USERS_{stamp}",
             "type": "tasks",
             "template": "kanban-basic",
             "allowed_roles": ["ceo", "buyer"],
@@ -299,26 +390,10 @@ class AdminFunctionalityTester:
             "owners": []
         }
         
-        success, response = self.run_test(
-            "Create board with users mode",
-            "POST",
-            "/boards",
-            201,
-            data=board_data_users
-        )
-        
-        created_board_users_id = None
-        if success and 'id' in response:
-            created_board_users_id = response['id']
-            self.created_resources['boards'].append(created_board_users_id)
-            self.log(f"   ✓ Created board (users mode) with ID: {created_board_users_id}")
-            self.log(f"   → Board name: {response.get('name', 'N/A')}")
-            self.log(f"   → Board key: {response.get('key', 'N/A')}")
-        
         # Test 2: Create board with groups mode visibility
         board_data_groups = {
-            "name": f"Test Board Groups Mode {datetime.now().strftime('%H%M%S')}",
-            "key": f"TEST_GROUPS_{datetime.now().strftime('%H%M%S')}",
+            "name": f"Test Board Groups Mode {stamp}",
+            "key": f"TEST_GROUPS_{stamp}",
             "type": "tasks",
             "template": "kanban-basic",
             "allowed_roles": ["ceo"],
@@ -327,39 +402,47 @@ class AdminFunctionalityTester:
             "owners": []
         }
         
-        success, response = self.run_test(
-            "Create board with groups mode",
-            "POST",
-            "/boards",
-            201,
-            data=board_data_groups
-        )
-        
-        created_board_groups_id = None
-        if success and 'id' in response:
-            created_board_groups_id = response['id']
-            self.created_resources['boards'].append(created_board_groups_id)
-            self.log(f"   ✓ Created board (groups mode) with ID: {created_board_groups_id}")
+        create_calls = [
+            ("Create board with users mode", "POST", "/boards", 201, board_data_users),
+            ("Create board with groups mode", "POST", "/boards", 201, board_data_groups),
+        ]
         
         # Test 3: Create board with default department
         if departments:
             board_data_with_dept = {
-                "name": f"Test Board With Dept {datetime.now().strftime('%H%M%S')}",
-                "key": f"TEST_DEPT_{datetime.now().strftime('%H%M%S')}",
+                "name": f"Test Board With Dept {stamp}",
+                "key": f"TEST_DEPT_{stamp}",
                 "type": "expenses",
                 "template": "kanban-basic",
                 "allowed_roles": ["ceo"],
                 "default_department_id": departments[0]['id']
             }
-            
-            success, response = self.run_test(
-                "Create board with default department",
-                "POST",
-                "/boards",
-                201,
-                data=board_data_with_dept
+            create_calls.append(
+                ("Create board with default department", "POST", "/boards", 201, board_data_with_dept)
             )
-            
+        
+        # The boards have distinct keys, so create them together instead of one RTT each
+        results = self.run_concurrently(self.run_test, create_calls)
+        self.cache.pop("/boards", None)
+        
+        success, response = results[0]
+        created_board_users_id = None
+        if success and 'id' in response:
+            created_board_users_id = response['id']
+            self.created_resources['boards'].append(created_board_users_id)
+            self.log(f"   ✓ Created board (users mode) with ID: {created_board_users_id}")
+            self.log(f"   → Board name: {response.get('name', 'N/A')}")
+            self.log(f"   → Board key: {response.get('key', 'N/A')}")
+        
+        success, response = results[1]
+        created_board_groups_id = None
+        if success and 'id' in response:
+            created_board_groups_id = response['id']
+            self.created_resources['boards'].append(created_board_groups_id)
+            self.log(f"   ✓ Created board (groups mode) with ID: {created_board_groups_id}")
+        
+        if departments:
+            success, response = results[2]
             if success and 'id' in response:
                 created_board_dept_id = response['id']
                 self.created_resources['boards'].append(created_board_dept_id)
@@ -377,7 +460,8 @@ class AdminFunctionalityTester:
             "POST",
             "/boards",
             422,  # Validation error
-            data=invalid_board_data
+            data=invalid_board_data,
+            parse_json=False
         )
         
         # Test 5: Test duplicate key validation
@@ -393,7 +477,8 @@ class AdminFunctionalityTester:
                 "POST",
                 "/boards",
                 400,
-                data=duplicate_key_data
+                data=duplicate_key_data,
+                parse_json=False
             )
         
         return True
@@ -402,17 +487,19 @@ class AdminFunctionalityTester:
         """Test Board Visibility Settings Save (PATCH /api/boards/{board_id}/visibility)"""
         self.log("\n🔒 Testing Board Visibility Settings...")
         
-        # Get existing boards to test visibility updates
-        success, response = self.run_test(
-            "Get existing boards for visibility testing",
-            "GET",
-            "/boards",
-            200
+        # Get existing boards to test visibility updates, plus users and groups for the settings
+        (boards_success, boards_response), (users_success, users_response), (groups_success, groups_response) = self.run_concurrently(
+            self.cached_get,
+            [
+                ("Get existing boards for visibility testing", "/boards"),
+                ("Get users for visibility settings", "/users"),
+                ("Get groups for visibility settings", "/admin/groups"),
+            ]
         )
         
         boards = []
-        if success:
-            boards = response
+        if boards_success:
+            boards = boards_response
             self.log(f"   ✓ Found {len(boards)} boards for visibility testing")
         
         if not boards:
@@ -422,20 +509,9 @@ class AdminFunctionalityTester:
         test_board = boards[0]
         board_id = test_board['id']
         
-        # Get users and groups for visibility settings
-        success, users_response = self.run_test(
-            "Get users for visibility settings",
-            "GET",
-            "/users",
-            200
-        )
-        
-        success, groups_response = self.run_test(
-            "Get groups for visibility settings",
-            "GET",
-            "/admin/groups",
-            200
-        )
+        if not (users_success and groups_success):
+            self.log("   ❌ Preparation lookups failed - skipping visibility tests")
+            return False
         
         users = users_response if users_response else []
         groups = groups_response if groups_response else []
@@ -515,14 +591,6 @@ class AdminFunctionalityTester:
             }
         }
         
-        self.run_test(
-            "Update visibility with invalid mode/data combination (should fail)",
-            "PATCH",
-            f"/boards/{board_id}/visibility",
-            400,
-            data=invalid_visibility_data
-        )
-        
         # Test 4: Test validation - users mode with group IDs (should fail)
         invalid_visibility_data_2 = {
             "visibility": {
@@ -532,21 +600,33 @@ class AdminFunctionalityTester:
             }
         }
         
-        self.run_test(
-            "Update visibility users mode with group IDs (should fail)",
-            "PATCH",
-            f"/boards/{board_id}/visibility",
-            400,
-            data=invalid_visibility_data_2
-        )
-        
-        # Test 5: Test with non-existent board ID
-        self.run_test(
-            "Update visibility for non-existent board (should fail)",
-            "PATCH",
-            "/boards/non-existent-board-id/visibility",
-            404,
-            data=visibility_users_data
+        # Tests 3-5 only exercise validation and do not change the board, so run them together
+        self.run_concurrently(
+            partial(self.run_test, parse_json=False),
+            [
+                (
+                    "Update visibility with invalid mode/data combination (should fail)",
+                    "PATCH",
+                    f"/boards/{board_id}/visibility",
+                    400,
+                    invalid_visibility_data
+                ),
+                (
+                    "Update visibility users mode with group IDs (should fail)",
+                    "PATCH",
+                    f"/boards/{board_id}/visibility",
+                    400,
+                    invalid_visibility_data_2
+                ),
+                # Test 5: Test with non-existent board ID
+                (
+                    "Update visibility for non-existent board (should fail)",
+                    "PATCH",
+                    "/boards/non-existent-board-id/visibility",
+                    404,
+                    visibility_users_data
+                ),
+            ]
         )
         
         return True
@@ -555,30 +635,25 @@ class AdminFunctionalityTester:
         """Test Department Users Lookup (GET /api/admin/users filtered by department)"""
         self.log("\n🏢 Testing Department Users Lookup...")
         
-        # Get all users first
-        success, response = self.run_test(
-            "Get all users for department filtering",
-            "GET",
-            "/users",
-            200
+        # Get all users and departments
+        (users_success, users_response), (departments_success, departments_response) = self.run_concurrently(
+            self.cached_get,
+            [
+                ("Get all users for department filtering", "/users"),
+                ("Get departments for user lookup", "/admin/departments"),
+            ]
         )
         
-        all_users = []
-        if success:
-            all_users = response
-            self.log(f"   ✓ Found {len(all_users)} total users")
+        if not users_success:
+            self.log("   ❌ Could not load users - skipping department lookup tests")
+            return False
         
-        # Get departments
-        success, response = self.run_test(
-            "Get departments for user lookup",
-            "GET",
-            "/admin/departments",
-            200
-        )
+        all_users = users_response
+        self.log(f"   ✓ Found {len(all_users)} total users")
         
         departments = []
-        if success:
-            departments = response
+        if departments_success:
+            departments = departments_response
             self.log(f"   ✓ Found {len(departments)} departments")
         
         # Test 1: Verify user data structure includes proper roles and group memberships
@@ -601,6 +676,25 @@ class AdminFunctionalityTester:
             else:
                 self.log(f"   ❌ User data missing fields: {missing_fields}")
         
+        # Index users by department and collect role/group stats in a single pass
+        users_by_dept = defaultdict(list)
+        role_types_found = set()
+        users_with_groups = 0
+        
+        for user in all_users:
+            users_by_dept[user.get('primary_department_id')].append(user)
+            
+            roles = user.get('roles', [])
+            if isinstance(roles, list):
+                for role in roles:
+                    if isinstance(role, dict):
+                        role_types_found.add(role.get('role', 'unknown'))
+                    else:
+                        role_types_found.add(str(role))
+            
+            if user.get('groups') and len(user.get('groups', [])) > 0:
+                users_with_groups += 1
+        
         # Test 2: Filter users by department (simulate department user modal)
         if departments and all_users:
             for dept in departments[:2]:  # Test first 2 departments
@@ -608,10 +702,7 @@ class AdminFunctionalityTester:
                 dept_name = dept['name']
                 
                 # Filter users by department manually (since there's no specific endpoint)
-                dept_users = [
-                    user for user in all_users 
-                    if user.get('primary_department_id') == dept_id
-                ]
+                dept_users = users_by_dept.get(dept_id, [])
                 
                 self.log(f"   → Department '{dept_name}' has {len(dept_users)} users")
                 
@@ -630,21 +721,6 @@ class AdminFunctionalityTester:
         
         # Test 3: Test user roles structure
         if all_users:
-            role_types_found = set()
-            users_with_groups = 0
-            
-            for user in all_users:
-                roles = user.get('roles', [])
-                if isinstance(roles, list):
-                    for role in roles:
-                        if isinstance(role, dict):
-                            role_types_found.add(role.get('role', 'unknown'))
-                        else:
-                            role_types_found.add(str(role))
-                
-                if user.get('groups') and len(user.get('groups', [])) > 0:
-                    users_with_groups += 1
-            
             self.log(f"   → Role types found: {sorted(list(role_types_found))}")
             self.log(f"   → Users with group memberships: {users_with_groups}")
         
@@ -670,24 +746,22 @@ class AdminFunctionalityTester:
         self.log("\n🧹 Cleaning up test resources...")
         
         # Clean up boards
-        for board_id in self.created_resources['boards']:
-            success, response = self.run_test(
-                f"Cleanup board {board_id}",
-                "DELETE",
-                f"/boards/{board_id}",
-                200
-            )
+        board_ids = self.created_resources['boards']
+        results = self.run_concurrently(
+            partial(self.run_test, parse_json=False),
+            [(f"Cleanup board {board_id}", "DELETE", f"/boards/{board_id}", 200) for board_id in board_ids]
+        )
+        for board_id, (success, response) in zip(board_ids, results):
             if success:
                 self.log(f"   ✓ Cleaned up board {board_id}")
         
         # Clean up groups
-        for group_id in self.created_resources['groups']:
-            success, response = self.run_test(
-                f"Cleanup group {group_id}",
-                "DELETE",
-                f"/admin/groups/{group_id}",
-                200
-            )
+        group_ids = self.created_resources['groups']
+        results = self.run_concurrently(
+            partial(self.run_test, parse_json=False),
+            [(f"Cleanup group {group_id}", "DELETE", f"/admin/groups/{group_id}", 200) for group_id in group_ids]
+        )
+        for group_id, (success, response) in zip(group_ids, results):
             if success:
                 self.log(f"   ✓ Cleaned up group {group_id}")
 
@@ -702,11 +776,15 @@ class AdminFunctionalityTester:
                 self.log("❌ CEO authentication failed, stopping")
                 return False
             
-            # Run test suites
-            self.test_group_crud_operations()
-            self.test_board_creation()
-            self.test_board_visibility_settings()
-            self.test_department_users_lookup()
+            # Run test suites, flushing the log after each one
+            for suite in (
+                self.test_group_crud_operations,
+                self.test_board_creation,
+                self.test_board_visibility_settings,
+                self.test_department_users_lookup,
+            ):
+                suite()
+                self.flush_log()
             
             # Clean up
             self.cleanup_resources()
@@ -732,6 +810,9 @@ class AdminFunctionalityTester:
         except Exception as e:
             self.log(f"❌ Test suite failed with error: {e}")
             return False
+        finally:
+            self.session.close()
+            self.flush_log()
 
 def main():
     """Main function"""
@@ -8,52 +8,118 @@ Tests the specific fixes mentioned in the review request:
 4. Department/Group CRUD Operations (/api/admin/ endpoints)
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import os
+import re
 import sys
 import json
-from datetime import datetime
+import time
+import uuid
+import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
+# Group names that indicate leftover placeholder/seed data
+BAD_GROUP_NAME_RE = re.compile(r'alpha beta|альфа|бета', re.IGNORECASE)
+
+# (connect, read) seconds; a dead host fails in 3s instead of hanging for the full read timeout
+REQUEST_TIMEOUT = (3, 30)
+
+# CEO token reused between runs until shortly before its JWT expiry
+TOKEN_CACHE_PATH = Path.home() / ".cache" / "adminsettings_token.json"
+
+# Buffered log lines are written out in batches of this size
+LOG_FLUSH_LINES = 64
 
 class AdminSettingsTester:
     def __init__(self, base_url="https://projectflow-37.preview.emergentagent.com"):
         self.base_url = base_url
         self.api_base = f"{base_url}/api"
         self.ceo_token = None
+        self.token_from_cache = False
+        self.auth_lock = threading.RLock()
         self.tests_run = 0
         self.tests_passed = 0
         self.failed_tests = []
+        # One suffix per run keeps created names unique and easy to trace back
+        self.run_suffix = uuid.uuid4().hex[:8]
+        self.cache = {}
+        self.lock = threading.Lock()
+        self.log_lock = threading.Lock()
+        self.log_buffer = []
+        self.session = requests.Session()
+        # Retry transient gateway errors with backoff. Only idempotent methods are retried
+        # so a replayed POST cannot create a duplicate and fail a later check.
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
 
     def log(self, message):
         """Log test messages"""
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        line = f"[{time.strftime('%H:%M:%S')}] {message}"
+        with self.log_lock:
+            self.log_buffer.append(line)
+            if len(self.log_buffer) >= LOG_FLUSH_LINES:
+                self._write_log_buffer()
+
+    def flush_log(self):
+        """Write out any buffered log lines"""
+        with self.log_lock:
+            self._write_log_buffer()
+
+    def _write_log_buffer(self):
+        if self.log_buffer:
+            sys.stdout.write("\n".join(self.log_buffer) + "\n")
+            sys.stdout.flush()
+            self.log_buffer.clear()
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
-        """Run a single API test"""
+    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, parse_json=True):
+        """Run a single API test; pass parse_json=False when only the status matters"""
         url = f"{self.api_base}{endpoint}"
-        test_headers = {'Content-Type': 'application/json'}
+        test_headers = {}
         
-        if self.ceo_token:
-            test_headers['Authorization'] = f'Bearer {self.ceo_token}'
+        used_token = self.ceo_token
+        if used_token:
+            test_headers['Authorization'] = f'Bearer {used_token}'
         elif headers:
             test_headers.update(headers)
 
-        self.tests_run += 1
+        with self.lock:
+            self.tests_run += 1
         self.log(f"🔍 Testing {name}...")
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'PATCH':
-                response = requests.patch(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=30)
+            response = self.session.request(method, url, json=data, headers=test_headers, timeout=REQUEST_TIMEOUT)
+            
+            # A cached token the server no longer accepts is replaced once, then the call is retried
+            if response.status_code == 401 and used_token and self.refresh_cached_token(used_token):
+                test_headers['Authorization'] = f'Bearer {self.ceo_token}'
+                response = self.session.request(method, url, json=data, headers=test_headers, timeout=REQUEST_TIMEOUT)
 
             success = response.status_code == expected_status
+            # Any accepted write (2xx), expected or not, makes cached listings of that resource stale;
+            # rejected writes change nothing and leave them valid
+            if method != 'GET' and 200 <= response.status_code < 300:
+                with self.lock:
+                    for path in [path for path in list(self.cache) if endpoint.startswith(path)]:
+                        self.cache.pop(path, None)
             if success:
-                self.tests_passed += 1
+                with self.lock:
+                    self.tests_passed += 1
                 self.log(f"✅ {name} - Status: {response.status_code}")
+                if not parse_json:
+                    return True, None
                 try:
                     return True, response.json() if response.content else {}
                 except:
@@ -77,10 +143,80 @@ class AdminSettingsTester:
             })
             return False, {}
 
-    def authenticate_ceo(self):
+    def cached_get(self, name, endpoint):
+        """Run a GET test once per endpoint and reuse the response until a write invalidates it"""
+        with self.lock:
+            if endpoint in self.cache:
+                return True, self.cache[endpoint]
+        
+        # The lock is not held across the request; run_test takes it for the counters
+        success, response = self.run_test(name, "GET", endpoint, 200)
+        if success:
+            with self.lock:
+                self.cache[endpoint] = response
+        return success, response
+
+    def run_concurrently(self, func, calls, max_workers=8):
+        """Run independent calls of func over the shared session, returning results in order"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda args: func(*args), calls))
+
+    def token_expiry(self, token):
+        """Read the exp claim from a JWT without verifying it (0 if unreadable)"""
+        try:
+            payload = token.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            return json.loads(base64.urlsafe_b64decode(payload)).get('exp', 0)
+        except (IndexError, ValueError, AttributeError):
+            return 0
+
+    def load_cached_token(self):
+        """Return the cached CEO token for this server if it is not about to expire"""
+        try:
+            cached = json.loads(TOKEN_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return None
+        
+        if cached.get('base_url') != self.base_url or cached.get('exp', 0) <= time.time() + 60:
+            return None
+        return cached.get('token')
+
+    def save_cached_token(self, token):
+        """Persist the CEO token (owner-readable only) for the next run"""
+        try:
+            TOKEN_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(TOKEN_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({"base_url": self.base_url, "token": token, "exp": self.token_expiry(token)}, f)
+        except OSError as e:
+            self.log(f"   ⚠️ Could not cache CEO token: {e}")
+
+    def refresh_cached_token(self, used_token):
+        """Swap a rejected cached token for a fresh login; True if the caller should retry"""
+        with self.auth_lock:
+            if used_token != self.ceo_token:
+                # Another call already replaced the token
+                return self.ceo_token is not None
+            if not self.token_from_cache:
+                return False
+            
+            self.log("   ⚠️ Cached CEO token was rejected, logging in again")
+            self.token_from_cache = False
+            self.ceo_token = None
+            TOKEN_CACHE_PATH.unlink(missing_ok=True)
+            return self.authenticate_ceo(use_cache=False)
+
+    def authenticate_ceo(self, use_cache=True):
         """Authenticate as CEO for admin-level access"""
         self.log("\n🔐 Authenticating as CEO...")
         
+        cached_token = self.load_cached_token() if use_cache else None
+        if cached_token:
+            self.ceo_token = cached_token
+            self.token_from_cache = True
+            self.log("   ✓ Reusing cached CEO token")
+            return True
+        
         success, response = self.run_test(
             "CEO Login",
             "POST",
@@ -91,22 +227,32 @@ class AdminSettingsTester:
         
         if success and 'access_token' in response:
             self.ceo_token = response['access_token']
+            self.save_cached_token(self.ceo_token)
             self.log(f"   ✓ CEO authenticated successfully")
             return True
         else:
             self.log(f"   ❌ CEO authentication failed")
             return False
 
+    def prime_fixtures(self):
+        """Load the shared listings every suite reads in one concurrent batch"""
+        self.log("\n📦 Loading shared fixtures...")
+        
+        self.run_concurrently(
+            self.cached_get,
+            [
+                ("Get all departments", "/admin/departments"),
+                ("Get all groups", "/admin/groups"),
+                ("Get all boards", "/boards"),
+                ("Get all users", "/users"),
+            ]
+        )
+
     def test_group_data_integrity(self):
         """Test that database contains proper group names"""
         self.log("\n📊 Testing Group Data Integrity...")
         
-        success, response = self.run_test(
-            "Get all groups",
-            "GET",
-            "/admin/groups",
-            200
-        )
+        success, response = self.cached_get("Get all groups", "/admin/groups")
         
         if success:
             groups = response
@@ -128,13 +274,12 @@ class AdminSettingsTester:
                     self.log(f"   ❌ Missing proper group: '{expected}'")
             
             # Check for bad group names (cyrillic text, 'alpha beta' pattern, empty names)
-            bad_patterns = ['alpha beta', 'альфа', 'бета']
             found_bad_groups = []
             
             for group_name in group_names:
                 # Check for cyrillic characters or specific bad patterns
-                has_cyrillic = any(ord(char) > 127 for char in group_name)
-                has_bad_pattern = any(bad in group_name.lower() for bad in bad_patterns)
+                has_cyrillic = not group_name.isascii()
+                has_bad_pattern = BAD_GROUP_NAME_RE.search(group_name) is not None
                 is_empty = not group_name.strip()
                 
                 if has_cyrillic or has_bad_pattern or is_empty:
@@ -156,12 +301,7 @@ class AdminSettingsTester:
         self.log("\n🏢 Testing Department CRUD Operations...")
         
         # Test 1: Get all departments
-        success, response = self.run_test(
-            "Get all departments",
-            "GET",
-            "/admin/departments",
-            200
-        )
+        success, response = self.cached_get("Get all departments", "/admin/departments")
         
         if success:
             departments = response
@@ -173,8 +313,7 @@ class AdminSettingsTester:
             return False
         
         # Test 2: Create new department with unique name
-        import uuid
-        unique_suffix = str(uuid.uuid4())[:8]
+        unique_suffix = self.run_suffix
         new_dept_data = {
             "name": f"Test Department AdminSettings {unique_suffix}",
             "type": "office"
@@ -202,7 +341,8 @@ class AdminSettingsTester:
             "POST",
             "/admin/departments",
             400,
-            data=new_dept_data
+            data=new_dept_data,
+            parse_json=False
         )
         
         return created_dept_id is not None
@@ -212,12 +352,7 @@ class AdminSettingsTester:
         self.log("\n👥 Testing Group CRUD Operations...")
         
         # First get departments to use for group creation
-        success, departments = self.run_test(
-            "Get departments for group creation",
-            "GET",
-            "/admin/departments",
-            200
-        )
+        success, departments = self.cached_get("Get departments for group creation", "/admin/departments")
         
         if not success or not departments:
             self.log(f"   ❌ Cannot test groups without departments")
@@ -226,12 +361,7 @@ class AdminSettingsTester:
         dept_id = departments[0]['id']
         
         # Test 1: Get all groups
-        success, response = self.run_test(
-            "Get all groups",
-            "GET",
-            "/admin/groups",
-            200
-        )
+        success, response = self.cached_get("Get all groups", "/admin/groups")
         
         if success:
             groups = response
@@ -241,8 +371,7 @@ class AdminSettingsTester:
             return False
         
         # Test 2: Create new group with unique name
-        import uuid
-        unique_suffix = str(uuid.uuid4())[:8]
+        unique_suffix = self.run_suffix
         new_group_data = {
             "name": f"Test Group AdminSettings {unique_suffix}",
             "department_id": dept_id,
@@ -273,8 +402,7 @@ class AdminSettingsTester:
         self.log("\n👤 Testing User Creation with Department Selection...")
         
         # Test 1: Create user with no department (null handling) with unique email
-        import uuid
-        unique_suffix = str(uuid.uuid4())[:8]
+        unique_suffix = self.run_suffix
         user_data_no_dept = {
             "email": f"testuser.nodept.{unique_suffix}@company.com",
             "password": "testpass123",
@@ -283,30 +411,12 @@ class AdminSettingsTester:
             "primary_department_id": None
         }
         
-        success, response = self.run_test(
-            "Create user with no department",
-            "POST",
-            "/admin/users",
-            201,
-            data=user_data_no_dept
-        )
-        
-        created_user_id_1 = None
-        if success and 'id' in response:
-            created_user_id_1 = response['id']
-            self.log(f"   ✅ Created user with no department - ID: {created_user_id_1}")
-            self.log(f"   → Email: {response.get('email')}")
-            self.log(f"   → Primary Department: {response.get('primary_department_id')}")
-        else:
-            self.log(f"   ❌ Failed to create user with no department")
+        create_calls = [
+            ("Create user with no department", "POST", "/admin/users", 201, user_data_no_dept),
+        ]
         
         # Test 2: Get departments for user creation with department
-        success, departments = self.run_test(
-            "Get departments for user creation",
-            "GET",
-            "/admin/departments",
-            200
-        )
+        success, departments = self.cached_get("Get departments for user creation", "/admin/departments")
         
         if success and departments:
             dept_id = departments[0]['id']
@@ -319,15 +429,38 @@ class AdminSettingsTester:
                 "roles": [{"role": "buyer", "department_id": dept_id}],
                 "primary_department_id": dept_id
             }
-            
-            success, response = self.run_test(
-                "Create user with department",
-                "POST",
-                "/admin/users",
-                201,
-                data=user_data_with_dept
+            create_calls.append(
+                ("Create user with department", "POST", "/admin/users", 201, user_data_with_dept)
             )
-            
+        
+        # Test 4: Test validation - missing required fields
+        invalid_user_data = {
+            "email": "invalid@company.com"
+            # Missing required fields
+        }
+        
+        # Only the duplicate-email check depends on another call, so send the creates and the
+        # validation check together; the 422 check only needs its status
+        with ThreadPoolExecutor(max_workers=len(create_calls) + 1) as executor:
+            futures = [executor.submit(self.run_test, *call) for call in create_calls]
+            executor.submit(
+                partial(self.run_test, parse_json=False),
+                "Create user with missing fields (should fail)", "POST", "/admin/users", 422, invalid_user_data
+            )
+        results = [future.result() for future in futures]
+        
+        success, response = results[0]
+        created_user_id_1 = None
+        if success and 'id' in response:
+            created_user_id_1 = response['id']
+            self.log(f"   ✅ Created user with no department - ID: {created_user_id_1}")
+            self.log(f"   → Email: {response.get('email')}")
+            self.log(f"   → Primary Department: {response.get('primary_department_id')}")
+        else:
+            self.log(f"   ❌ Failed to create user with no department")
+        
+        if len(results) > 1:
+            success, response = results[1]
             created_user_id_2 = None
             if success and 'id' in response:
                 created_user_id_2 = response['id']
@@ -337,20 +470,6 @@ class AdminSettingsTester:
             else:
                 self.log(f"   ❌ Failed to create user with department")
         
-        # Test 4: Test validation - missing required fields
-        invalid_user_data = {
-            "email": "invalid@company.com"
-            # Missing required fields
-        }
-        
-        self.run_test(
-            "Create user with missing fields (should fail)",
-            "POST",
-            "/admin/users",
-            422,  # Validation error
-            data=invalid_user_data
-        )
-        
         # Test 5: Test duplicate email validation
         if created_user_id_1:
             duplicate_user_data = {
@@ -365,7 +484,8 @@ class AdminSettingsTester:
                 "POST",
                 "/admin/users",
                 400,
-                data=duplicate_user_data
+                data=duplicate_user_data,
+                parse_json=False
             )
         
         return created_user_id_1 is not None
@@ -374,12 +494,14 @@ class AdminSettingsTester:
         """Test Board Visibility Settings API"""
         self.log("\n👁️ Testing Board Visibility Settings API...")
         
-        # First get all boards to find one to test with
-        success, boards = self.run_test(
-            "Get all boards",
-            "GET",
-            "/boards",
-            200
+        # Get boards to find one to test with, plus users and groups for the settings
+        (success, boards), (_, users), (_, groups) = self.run_concurrently(
+            self.cached_get,
+            [
+                ("Get all boards", "/boards"),
+                ("Get users for visibility testing", "/users"),
+                ("Get groups for visibility testing", "/admin/groups"),
+            ]
         )
         
         if not success or not boards:
@@ -393,21 +515,6 @@ class AdminSettingsTester:
         
         self.log(f"   → Testing with board: {board_key} (ID: {board_id})")
         
-        # Get users and groups for visibility testing
-        success, users = self.run_test(
-            "Get users for visibility testing",
-            "GET",
-            "/users",
-            200
-        )
-        
-        success, groups = self.run_test(
-            "Get groups for visibility testing",
-            "GET",
-            "/admin/groups",
-            200
-        )
-        
         if not users or not groups:
             self.log(f"   ❌ Need users and groups for visibility testing")
             return False
@@ -488,14 +595,6 @@ class AdminSettingsTester:
             }
         }
         
-        self.run_test(
-            "Invalid users mode with group IDs (should fail)",
-            "PATCH",
-            f"/boards/{board_id}/visibility",
-            400,
-            data=invalid_users_mode_data
-        )
-        
         # Test 4: Test validation - groups mode with user IDs (should fail)
         invalid_groups_mode_data = {
             "visibility": {
@@ -505,21 +604,33 @@ class AdminSettingsTester:
             }
         }
         
-        self.run_test(
-            "Invalid groups mode with user IDs (should fail)",
-            "PATCH",
-            f"/boards/{board_id}/visibility",
-            400,
-            data=invalid_groups_mode_data
-        )
-        
-        # Test 5: Test with non-existent board ID
-        self.run_test(
-            "Update visibility for non-existent board (should fail)",
-            "PATCH",
-            "/boards/non-existent-board-id/visibility",
-            404,
-            data=users_visibility_data
+        # Tests 3-5 are rejected by validation and leave the board untouched, so send them together
+        self.run_concurrently(
+            partial(self.run_test, parse_json=False),
+            [
+                (
+                    "Invalid users mode with group IDs (should fail)",
+                    "PATCH",
+                    f"/boards/{board_id}/visibility",
+                    400,
+                    invalid_users_mode_data
+                ),
+                (
+                    "Invalid groups mode with user IDs (should fail)",
+                    "PATCH",
+                    f"/boards/{board_id}/visibility",
+                    400,
+                    invalid_groups_mode_data
+                ),
+                # Test 5: Test with non-existent board ID
+                (
+                    "Update visibility for non-existent board (should fail)",
+                    "PATCH",
+                    "/boards/non-existent-board-id/visibility",
+                    404,
+                    users_visibility_data
+                ),
+            ]
         )
         
         return True
@@ -535,12 +646,17 @@ class AdminSettingsTester:
                 self.log("❌ CEO authentication failed, stopping")
                 return False
             
-            # Run test suites
-            self.test_group_data_integrity()
-            self.test_department_crud()
-            self.test_group_crud()
-            self.test_user_creation_with_department()
-            self.test_board_visibility_settings()
+            # Prime the shared fixtures, then run test suites, flushing the log after each one
+            self.prime_fixtures()
+            for suite in (
+                self.test_group_data_integrity,
+                self.test_department_crud,
+                self.test_group_crud,
+                self.test_user_creation_with_department,
+                self.test_board_visibility_settings,
+            ):
+                suite()
+                self.flush_log()
             
             # Print summary
             self.log(f"\n📊 AdminSettings Test Summary:")
@@ -563,6 +679,9 @@ class AdminSettingsTester:
         except Exception as e:
             self.log(f"❌ Test suite failed with error: {e}")
             return False
+        finally:
+            self.session.close()
+            self.flush_log()
 
 def main():
     """Main function"""
@@ -4,77 +4,176 @@ Assignee Selection Functionality Testing
 Tests the specific assignee selection functionality after fixing SelectItem empty string value error.
 """
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import sys
 import json
-from datetime import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+from time import strftime
+
+# Methods that carry a JSON body; anything else is sent without one
+BODY_METHODS = frozenset(['POST', 'PUT', 'PATCH'])
+REQUEST_TIMEOUT = 30
+
+UNASSIGN_BODY = b'{"assignee_id": null}'
+
+def assignee_body(assignee_id):
+    """Pre-encoded JSON body for PATCH /tasks/{id} assignee changes (ids are UUIDs, no escaping needed)"""
+    if assignee_id is None:
+        return UNASSIGN_BODY
+    return f'{{"assignee_id": "{assignee_id}"}}'.encode()
+
+@dataclass(slots=True)
+class Failure:
+    """A failed check: either a status mismatch or an exception raised while calling"""
+    test: str
+    expected: int = 0
+    actual: int = 0
+    response: str = ''
+    error: Optional[str] = None
 
 class AssigneeSelectionTester:
     def __init__(self, base_url="https://projectflow-37.preview.emergentagent.com"):
         self.base_url = base_url
         self.api_base = f"{base_url}/api"
         self.tokens = {}
+        self.auth_headers = {}
         self.users = {}
+        self.all_users = []
+        self.users_by_id = {}
+        self.non_admin_users = ()
+        self.board_ctx = None
         self.test_task_id = None
         self.tests_run = 0
         self.tests_passed = 0
         self.failed_tests = []
+        self.lock = threading.Lock()
+        self.session = requests.Session()
+        # Retry transient gateway errors; POST/PATCH are left alone so a replay cannot double-apply
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'PUT', 'DELETE']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json'})
 
     def log(self, message):
         """Log test messages"""
-        print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        print(f"[{strftime('%H:%M:%S')}] {message}")
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, user_token=None):
-        """Run a single API test"""
+    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None, user_token=None, role=None, body=None, parse_json=True):
+        """Run a single API test; role= picks the logged-in user's prebuilt auth headers,
+        body= sends already-encoded JSON bytes instead of serializing data, and
+        parse_json=False skips reading the body when only the status matters"""
         url = f"{self.api_base}{endpoint}"
-        test_headers = {'Content-Type': 'application/json'}
-        
-        if user_token:
-            test_headers['Authorization'] = f'Bearer {user_token}'
-        elif headers:
-            test_headers.update(headers)
+        # Content-Type lives on the session; only Authorization varies per call
+        if role:
+            test_headers = self.auth_headers[role]
+        elif user_token:
+            test_headers = {'Authorization': f'Bearer {user_token}'}
+        else:
+            test_headers = headers
 
-        self.tests_run += 1
+        with self.lock:
+            self.tests_run += 1
         self.log(f"🔍 Testing {name}...")
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'PATCH':
-                response = requests.patch(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=30)
+            response = self.session.request(
+                method,
+                url,
+                json=data if method in BODY_METHODS else None,
+                data=body,
+                headers=test_headers,
+                timeout=REQUEST_TIMEOUT,
+                # Stream so failure bodies are never read past the logged snippet
+                stream=True
+            )
 
             success = response.status_code == expected_status
             if success:
-                self.tests_passed += 1
+                with self.lock:
+                    self.tests_passed += 1
                 self.log(f"✅ {name} - Status: {response.status_code}")
+                if not parse_json:
+                    self._discard_body(response)
+                    return True, None
+                # Only decode bodies that are actually JSON; 204s and HTML pages return {}
+                if not response.headers.get('Content-Type', '').startswith('application/json'):
+                    self._discard_body(response)
+                    return True, {}
+                if not response.content:
+                    return True, {}
                 try:
-                    return True, response.json() if response.content else {}
-                except:
+                    return True, response.json()
+                except ValueError:
                     return True, {}
             else:
+                # Read only the first 300 bytes instead of decoding the whole body
+                snippet = response.raw.read(300, decode_content=True).decode('utf-8', errors='replace')
+                response.close()
                 self.log(f"❌ {name} - Expected {expected_status}, got {response.status_code}")
-                self.log(f"   Response: {response.text[:300]}")
-                self.failed_tests.append({
-                    "test": name,
-                    "expected": expected_status,
-                    "actual": response.status_code,
-                    "response": response.text[:300]
-                })
+                self.log(f"   Response: {snippet}")
+                self.failed_tests.append(Failure(name, expected_status, response.status_code, snippet))
                 return False, {}
 
         except Exception as e:
             self.log(f"❌ {name} - Error: {str(e)}")
-            self.failed_tests.append({
-                "test": name,
-                "error": str(e)
-            })
+            self.failed_tests.append(Failure(name, error=str(e)))
             return False, {}
 
+    def _discard_body(self, response):
+        """Drain a streamed body without keeping it so the connection returns to the pool"""
+        for _ in response.iter_content(chunk_size=8192):
+            pass
+        response.close()
+
+    def run_concurrently(self, func, calls, max_workers=8):
+        """Run independent calls of func over the shared session, returning results in order"""
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda args: func(*args), calls))
+
+    def get_as(self, name, endpoint, role, parse_json=True):
+        """GET endpoint expecting 200 as the given role"""
+        return self.run_test(name, "GET", endpoint, 200, role=role, parse_json=parse_json)
+
+    def get_board_ctx(self):
+        """Look up (board_id, board_key, column_id) for task tests once and reuse it"""
+        if self.board_ctx is None:
+            success, boards_response = self.run_test(
+                "Get boards for task creation",
+                "GET",
+                "/boards",
+                200,
+                role='admin'
+            )
+            
+            if success and boards_response:
+                board = boards_response[0]
+                board_id = board['id']
+                board_key = board['key']
+                
+                # Get columns for the board
+                success, columns_response = self.run_test(
+                    f"Get columns for board {board_key}",
+                    "GET",
+                    f"/boards/{board_id}/columns",
+                    200,
+                    role='admin'
+                )
+                
+                if success and columns_response:
+                    self.board_ctx = (board_id, board_key, columns_response[0]['id'])
+        return self.board_ctx
+
     def setup_authentication(self):
         """Setup authentication for admin and buyer users"""
         self.log("\n🔐 Setting up Authentication...")
@@ -85,17 +184,21 @@ class AssigneeSelectionTester:
             {"email": "buyer@company.com", "password": "buyer123", "role": "buyer"}
         ]
         
-        for user_data in test_users:
-            success, response = self.run_test(
-                f"Login as {user_data['role']}",
-                "POST",
-                "/auth/login",
-                200,
-                data={"email": user_data["email"], "password": user_data["password"]}
-            )
-            
+        # Logins are independent, so issue them together and collect in order
+        results = self.run_concurrently(
+            self.run_test,
+            [
+                (f"Login as {user_data['role']}", "POST", "/auth/login", 200,
+                 {"email": user_data["email"], "password": user_data["password"]})
+                for user_data in test_users
+            ],
+            max_workers=len(test_users)
+        )
+        
+        for user_data, (success, response) in zip(test_users, results):
             if success and 'access_token' in response:
                 self.tokens[user_data['role']] = response['access_token']
+                self.auth_headers[user_data['role']] = {'Authorization': f"Bearer {response['access_token']}"}
                 self.users[user_data['role']] = response['user']
                 self.log(f"   ✓ Got token for {user_data['role']}: {response['user']['full_name']}")
             else:
@@ -108,15 +211,16 @@ class AssigneeSelectionTester:
         """Test GET /api/users endpoint for assignee selection"""
         self.log("\n👥 Testing User List API for Assignee Selection...")
         
+        # Both roles fetch the list independently, so issue the requests together
+        roles = [role for role in ('admin', 'buyer') if role in self.tokens]
+        results = dict(zip(roles, self.run_concurrently(
+            self.get_as,
+            [(f"GET /api/users as {role}", "/users", role) for role in roles]
+        )))
+        
         # Test 1: Admin should be able to get users list
-        if 'admin' in self.tokens:
-            success, response = self.run_test(
-                "GET /api/users as admin",
-                "GET",
-                "/users",
-                200,
-                user_token=self.tokens['admin']
-            )
+        if 'admin' in results:
+            success, response = results['admin']
             
             if success:
                 users = response
@@ -134,21 +238,17 @@ class AssigneeSelectionTester:
                     else:
                         self.log(f"   ❌ User objects missing fields: {missing_fields}")
                 
-                # Store users for later tests
+                # Store users for later tests, indexed once so they aren't rescanned per test
                 self.all_users = users
+                self.users_by_id = {user['id']: user for user in users}
+                self.non_admin_users = tuple(user for user in users if 'admin' not in user.get('roles', []))
             else:
                 self.log(f"   ❌ Admin failed to get users list")
                 return False
         
         # Test 2: Buyer should also be able to get users list (per requirement: "assignee selection available for all users")
-        if 'buyer' in self.tokens:
-            success, response = self.run_test(
-                "GET /api/users as buyer",
-                "GET",
-                "/users",
-                200,
-                user_token=self.tokens['buyer']
-            )
+        if 'buyer' in results:
+            success, response = results['buyer']
             
             if success:
                 users = response
@@ -163,83 +263,56 @@ class AssigneeSelectionTester:
         """Test POST /api/tasks with assignee_id field"""
         self.log("\n➕ Testing Task Creation with Assignee...")
         
-        if not hasattr(self, 'all_users') or not self.all_users:
+        if not self.all_users:
             self.log("   ❌ No users available for assignee testing")
             return False
         
-        # Get a test assignee (first non-admin user)
-        test_assignee = None
-        for user in self.all_users:
-            if 'admin' not in user.get('roles', []):
-                test_assignee = user
-                break
-        
-        if not test_assignee:
-            test_assignee = self.all_users[0]  # Fallback to first user
+        # Get a test assignee (first non-admin user, falling back to the first user)
+        test_assignee = self.non_admin_users[0] if self.non_admin_users else self.all_users[0]
         
         # Test 1: Create task with assignee as admin
-        if 'admin' in self.tokens:
-            # First, get a board and column for task creation
-            success, boards_response = self.run_test(
-                "Get boards for task creation",
-                "GET",
-                "/boards",
-                200,
-                user_token=self.tokens['admin']
-            )
+        board_ctx = self.get_board_ctx() if 'admin' in self.tokens else None
+        if not board_ctx:
+            self.log("   ❌ No board/column available for task creation")
+            return False
+        
+        board_id, board_key, column_id = board_ctx
+        
+        # Create task with assignee
+        task_data = {
+            "board_key": board_key,
+            "column_id": column_id,
+            "title": "Test Task with Assignee",
+            "description": "Testing assignee selection functionality",
+            "assignee_id": test_assignee['id'],
+            "priority": "medium"
+        }
+        
+        success, response = self.run_test(
+            "POST /api/tasks with assignee_id",
+            "POST",
+            "/tasks",
+            201,
+            data=task_data,
+            role='admin'
+        )
+        
+        if success and 'id' in response:
+            self.test_task_id = response['id']
+            self.log(f"   ✓ Created task with assignee: {test_assignee['full_name']}")
+            self.log(f"   → Task ID: {self.test_task_id}")
             
-            if success and boards_response:
-                board = boards_response[0]
-                board_id = board['id']
-                board_key = board['key']
-                
-                # Get columns for the board
-                success, columns_response = self.run_test(
-                    f"Get columns for board {board_key}",
-                    "GET",
-                    f"/boards/{board_id}/columns",
-                    200,
-                    user_token=self.tokens['admin']
-                )
-                
-                if success and columns_response:
-                    column_id = columns_response[0]['id']
-                    
-                    # Create task with assignee
-                    task_data = {
-                        "board_key": board_key,
-                        "column_id": column_id,
-                        "title": "Test Task with Assignee",
-                        "description": "Testing assignee selection functionality",
-                        "assignee_id": test_assignee['id'],
-                        "priority": "medium"
-                    }
-                    
-                    success, response = self.run_test(
-                        "POST /api/tasks with assignee_id",
-                        "POST",
-                        "/tasks",
-                        201,
-                        data=task_data,
-                        user_token=self.tokens['admin']
-                    )
-                    
-                    if success and 'id' in response:
-                        self.test_task_id = response['id']
-                        self.log(f"   ✓ Created task with assignee: {test_assignee['full_name']}")
-                        self.log(f"   → Task ID: {self.test_task_id}")
-                        
-                        # Verify assignee_id is correctly set
-                        if response.get('assignee_id') == test_assignee['id']:
-                            self.log(f"   ✓ Assignee ID correctly set in created task")
-                        else:
-                            self.log(f"   ❌ Assignee ID mismatch - Expected: {test_assignee['id']}, Got: {response.get('assignee_id')}")
-                    else:
-                        self.log(f"   ❌ Failed to create task with assignee")
-                        return False
+            # Verify assignee_id is correctly set
+            if response.get('assignee_id') == test_assignee['id']:
+                self.log(f"   ✓ Assignee ID correctly set in created task")
+            else:
+                self.log(f"   ❌ Assignee ID mismatch - Expected: {test_assignee['id']}, Got: {response.get('assignee_id')}")
+        else:
+            self.log(f"   ❌ Failed to create task with assignee")
+            return False
         
-        # Test 2: Create task without assignee (null/unassigned)
-        if 'admin' in self.tokens and 'board_key' in locals() and 'column_id' in locals():
+        # Test 2: Create task without assignee (null/unassigned), only once creation is known to work
+        if self.test_task_id:
             task_data_no_assignee = {
                 "board_key": board_key,
                 "column_id": column_id,
@@ -255,7 +328,7 @@ class AssigneeSelectionTester:
                 "/tasks",
                 201,
                 data=task_data_no_assignee,
-                user_token=self.tokens['admin']
+                role='admin'
             )
             
             if success:
@@ -277,33 +350,24 @@ class AssigneeSelectionTester:
             self.log("   ❌ No test task available for assignee update testing")
             return False
         
-        if not hasattr(self, 'all_users') or not self.all_users:
+        if not self.all_users:
             self.log("   ❌ No users available for assignee testing")
             return False
         
-        # Get different assignees for testing
-        assignee1 = None
-        assignee2 = None
-        for user in self.all_users:
-            if assignee1 is None:
-                assignee1 = user
-            elif assignee2 is None and user['id'] != assignee1['id']:
-                assignee2 = user
-                break
+        # Get different assignees for testing (users_by_id holds one entry per distinct id)
+        distinct_users = list(self.users_by_id.values())
+        assignee1 = distinct_users[0] if distinct_users else None
+        assignee2 = distinct_users[1] if len(distinct_users) > 1 else None
         
         # Test 1: Update task assignee as admin
         if 'admin' in self.tokens and assignee1:
-            update_data = {
-                "assignee_id": assignee1['id']
-            }
-            
             success, response = self.run_test(
                 f"PATCH /api/tasks/{self.test_task_id} - assign to user",
                 "PATCH",
                 f"/tasks/{self.test_task_id}",
                 200,
-                data=update_data,
-                user_token=self.tokens['admin']
+                body=assignee_body(assignee1['id']),
+                role='admin'
             )
             
             if success:
@@ -317,17 +381,13 @@ class AssigneeSelectionTester:
         
         # Test 2: Change assignee to different user
         if 'admin' in self.tokens and assignee2:
-            update_data = {
-                "assignee_id": assignee2['id']
-            }
-            
             success, response = self.run_test(
                 f"PATCH /api/tasks/{self.test_task_id} - change assignee",
                 "PATCH",
                 f"/tasks/{self.test_task_id}",
                 200,
-                data=update_data,
-                user_token=self.tokens['admin']
+                body=assignee_body(assignee2['id']),
+                role='admin'
             )
             
             if success:
@@ -337,17 +397,13 @@ class AssigneeSelectionTester:
         
         # Test 3: Unassign task (set assignee_id to null)
         if 'admin' in self.tokens:
-            update_data = {
-                "assignee_id": None
-            }
-            
             success, response = self.run_test(
                 f"PATCH /api/tasks/{self.test_task_id} - unassign task",
                 "PATCH",
                 f"/tasks/{self.test_task_id}",
                 200,
-                data=update_data,
-                user_token=self.tokens['admin']
+                body=assignee_body(None),
+                role='admin'
             )
             
             if success:
@@ -361,17 +417,13 @@ class AssigneeSelectionTester:
         
         # Test 4: Test assignee update as buyer (should work per requirement)
         if 'buyer' in self.tokens and assignee1:
-            update_data = {
-                "assignee_id": assignee1['id']
-            }
-            
             success, response = self.run_test(
                 f"PATCH /api/tasks/{self.test_task_id} - assign as buyer",
                 "PATCH",
                 f"/tasks/{self.test_task_id}",
                 200,
-                data=update_data,
-                user_token=self.tokens['buyer']
+                body=assignee_body(assignee1['id']),
+                role='buyer'
             )
             
             if success:
@@ -387,40 +439,36 @@ class AssigneeSelectionTester:
         self.log("\n🔐 Testing Role-Based Access for Assignee Functionality...")
         
         # Test that both admin and buyer can access user list and modify assignees
-        roles_to_test = ['admin', 'buyer']
+        roles_to_test = [role for role in ('admin', 'buyer') if role in self.tokens]
         
+        # Every (role, endpoint) check is independent, so run the whole matrix together
+        calls = []
         for role in roles_to_test:
-            if role in self.tokens:
-                self.log(f"\n   Testing {role} role access:")
-                
-                # Test 1: Can get users list
-                success, response = self.run_test(
-                    f"GET /api/users as {role}",
-                    "GET",
-                    "/users",
-                    200,
-                    user_token=self.tokens[role]
-                )
-                
-                if success:
-                    self.log(f"   ✓ {role} can access users list for assignee selection")
-                else:
-                    self.log(f"   ❌ {role} cannot access users list")
-                
-                # Test 2: Can access own profile
-                user_id = self.users[role]['id']
-                success, response = self.run_test(
-                    f"GET /api/users/{user_id} as {role}",
-                    "GET",
-                    f"/users/{user_id}",
-                    200,
-                    user_token=self.tokens[role]
-                )
-                
-                if success:
-                    self.log(f"   ✓ {role} can access own user profile")
-                else:
-                    self.log(f"   ❌ {role} cannot access own user profile")
+            user_id = self.users[role]['id']
+            calls.append((f"GET /api/users as {role}", "/users", role))
+            # Only authorization is checked here, so the profile body is not decoded.
+            # HEAD would be cheaper still, but FastAPI routes only GET for this endpoint.
+            calls.append((f"GET /api/users/{user_id} as {role}", f"/users/{user_id}", role, False))
+        results = iter(self.run_concurrently(self.get_as, calls))
+        
+        for role in roles_to_test:
+            self.log(f"\n   Testing {role} role access:")
+            
+            # Test 1: Can get users list
+            success, response = next(results)
+            
+            if success:
+                self.log(f"   ✓ {role} can access users list for assignee selection")
+            else:
+                self.log(f"   ❌ {role} cannot access users list")
+            
+            # Test 2: Can access own profile
+            success, response = next(results)
+            
+            if success:
+                self.log(f"   ✓ {role} can access own user profile")
+            else:
+                self.log(f"   ❌ {role} cannot access own user profile")
 
     def run_assignee_tests(self):
         """Run all assignee selection tests"""
@@ -434,10 +482,12 @@ class AssigneeSelectionTester:
                 self.log("❌ Authentication setup failed, stopping")
                 return False
             
-            # Run specific assignee tests
-            self.test_user_list_api()
-            self.test_task_creation_with_assignee()
-            self.test_task_assignee_updates()
+            # Run specific assignee tests; the task tests depend on the user list and on
+            # each other, so stop that chain at the first failure instead of issuing doomed calls
+            if not self.test_user_list_api():
+                self.log("❌ User list unavailable, skipping task assignee tests")
+            elif self.test_task_creation_with_assignee():
+                self.test_task_assignee_updates()
             self.test_role_based_access()
             
             # Print summary
@@ -458,19 +508,20 @@ class AssigneeSelectionTester:
             if self.failed_tests:
                 self.log(f"\n❌ Failed Tests Details:")
                 for failure in self.failed_tests:
-                    self.log(f"   - {failure['test']}")
-                    if 'error' in failure:
-                        self.log(f"     Error: {failure['error']}")
+                    self.log(f"   - {failure.test}")
+                    if failure.error is not None:
+                        self.log(f"     Error: {failure.error}")
                     else:
-                        self.log(f"     Expected: {failure['expected']}, Got: {failure['actual']}")
-                        if 'response' in failure:
-                            self.log(f"     Response: {failure['response']}")
+                        self.log(f"     Expected: {failure.expected}, Got: {failure.actual}")
+                        self.log(f"     Response: {failure.response}")
             
             return self.tests_passed == self.tests_run
             
         except Exception as e:
             self.log(f"❌ Assignee selection test suite failed with error: {e}")
             return False
+        finally:
+            self.session.close()
 
 def main():
     """Main function"""
@@ -4,32 +4,69 @@
 Seed v2 for Department-based ACL system (FIXED to match current Mongoose schema)
 Создаёт департаменты, группы, юзеров (с указанными логинами/паролями), борды, колонки, задачи.
 — Без passlib, только pyca/bcrypt (пароль режем до 72 байт).
-— Перед заливкой сбрасываем индексы и создаём правильные (чтобы не ловить E11000 key:null).
+— Коллекции дропаем вместе со старыми индексами, заливаем, затем строим правильные (чтобы не ловить E11000 key:null).
 — Исправления: fullName, passwordHash, roles:[string], флаги активации, createdAt/updatedAt.
 """
 
 import asyncio
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from urllib.parse import urlparse  # оставляю как в твоём оригинале
 
 from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel
 import bcrypt as pybcrypt
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / ".env")
 
 # ---------- Mongo ----------
-MONGO_URL = os.environ["MONGO_URL"]
+# MONGO_URL читаем в main(): без него модуль всё равно импортируется (тесты, переиспользование хелперов)
 # Если DB_NAME не задан, возьмём 'simplified_jira'
 DB_NAME = os.getenv("DB_NAME") or "simplified_jira"
 
-client = AsyncIOMotorClient(MONGO_URL)
-db = client[DB_NAME]
+# Стоимость bcrypt. По умолчанию 12, как у gensalt(): это реальные логины.
+# Для локальной/CI базы можно SEED_BCRYPT_ROUNDS=4 — хеширование станет в ~256 раз дешевле.
+SEED_BCRYPT_ROUNDS = int(os.getenv("SEED_BCRYPT_ROUNDS") or 12)
+
+# ---------- учётки: email -> пароль (источник и для хешей, и для вывода) ----------
+SEED_CREDENTIALS = {
+    "admin@company.com": "admin123",
+    "tech1@gambling.local": "f@DOr&hVMLfk",
+    "tech2@gambling.local": "tW&hdG4g$yDy",
+    "buyertech1@gambling.local": "NkHSF&sdwPKq",
+    "buyertech2@gambling.local": "lHq52bN&QHV5",
+    "designer1@gambling.local": "sC#0ss0WYccc",
+    "designer2@gambling.local": "RbxTdBZeqwAB",
+    "tl1@gambling.local": "@gNB#X4wYJ8#",
+    "tl2@gambling.local": "LE3qVN1aFkL2",
+    "buyer1@swip.local": "N8of*c1fVtXJ",
+    "buyer2@swip.local": "a4ytL%20SSHe",
+    "tech1@swip.local": "tech1@swip.local",
+    "tech2@swip.local": "$h%VNGYbo2sF",
+    "designer1@swip.local": "$X!vu6B4PrLb",
+    "designer2@swip.local": "0AuKjlC0f7a6",
+    "tl1@swip.local": "l8Tm9eQRfp$b",
+    "tl2@swip.local": "6gStI9Oj#RqO",
+}
 
 # ---------- helpers ----------
+# Вывод копим в буфере и пишем одним write() в конце прогона (см. main)
+_out_lines = []
+
+def say(line=""):
+    _out_lines.append(line)
+
+def flush_out():
+    if _out_lines:
+        sys.stdout.write("\n".join(_out_lines) + "\n")
+        sys.stdout.flush()
+        _out_lines.clear()
+
 def now_utc():
     return datetime.now(timezone.utc)
 
@@ -38,66 +75,46 @@ def hash_pw(p: str) -> str:
     if not isinstance(p, str):
         p = str(p)
     data = p.encode("utf-8")[:72]
-    return pybcrypt.hashpw(data, pybcrypt.gensalt()).decode("utf-8")
-
-# ---------- housekeeping: clear + indexes ----------
-async def clear_collections():
-    print("Clearing existing data...")
-    await db.users.delete_many({})
-    await db.departments.delete_many({})
-    await db.groups.delete_many({})
-    await db.boards.delete_many({})
-    await db.columns.delete_many({})
-    await db.tasks.delete_many({})
-    print("✓ Cleared all collections")
-
-async def reset_indexes():
-    """Сносим старые индексы и создаём корректные уникальные по нужным полям."""
-    print("Resetting indexes...")
-
-    # Departments
-    try: await db.departments.drop_indexes()
-    except Exception: pass
-    await db.departments.create_index("id", unique=True)
-    await db.departments.create_index("key", unique=True)
+    return pybcrypt.hashpw(data, pybcrypt.gensalt(rounds=SEED_BCRYPT_ROUNDS)).decode("utf-8")
 
-    # Groups
-    try: await db.groups.drop_indexes()
-    except Exception: pass
-    await db.groups.create_index("id", unique=True)
-    await db.groups.create_index("key", unique=True)
+async def hash_passwords(credentials):
+    """Хешируем все пароли параллельно. pyca/bcrypt отпускает GIL, поэтому хватает потоков."""
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=min(len(credentials), os.cpu_count() or 1)) as pool:
+        hashes = await asyncio.gather(
+            *(loop.run_in_executor(pool, hash_pw, pw) for pw in credentials.values())
+        )
+    return dict(zip(credentials, hashes))
 
-    # Boards
-    try: await db.boards.drop_indexes()
-    except Exception: pass
-    await db.boards.create_index("id", unique=True)
-    await db.boards.create_index("key", unique=True)
-
-    # Columns
-    try: await db.columns.drop_indexes()
-    except Exception: pass
-    await db.columns.create_index("id", unique=True)
-    await db.columns.create_index([("board_id", 1), ("key", 1)], unique=True)
+# ---------- housekeeping: clear + indexes ----------
+SEED_COLLECTIONS = ("users", "departments", "groups", "boards", "columns", "tasks")
 
-    # Users
-    try: await db.users.drop_indexes()
-    except Exception: pass
-    await db.users.create_index("id", unique=True)
-    await db.users.create_index("email", unique=True)
+async def clear_collections(db):
+    say("Clearing existing data...")
+    # drop() снимает коллекцию целиком (без удаления по документу), все шесть — параллельно.
+    # Индексы уходят вместе с коллекцией; create_indexes() строит их после заливки.
+    await asyncio.gather(*(db[name].drop() for name in SEED_COLLECTIONS))
+    say("✓ Cleared all collections")
 
-    # Tasks
-    try: await db.tasks.drop_indexes()
-    except Exception: pass
-    await db.tasks.create_index("id", unique=True)
-    await db.tasks.create_index("board_key")
-    await db.tasks.create_index("department_id")
+SEED_INDEXES = {
+    "departments": [IndexModel("id", unique=True), IndexModel("key", unique=True)],
+    "groups": [IndexModel("id", unique=True), IndexModel("key", unique=True)],
+    "boards": [IndexModel("id", unique=True), IndexModel("key", unique=True)],
+    "columns": [IndexModel("id", unique=True), IndexModel([("board_id", 1), ("key", 1)], unique=True)],
+    "users": [IndexModel("id", unique=True), IndexModel("email", unique=True)],
+    "tasks": [IndexModel("id", unique=True), IndexModel("board_key"), IndexModel("department_id")],
+}
 
-    print("✓ Indexes reset")
+async def create_indexes(db):
+    """Строим индексы уже после заливки: одна сборка на индекс вместо обновления B-дерева на каждую вставку.
+    Старых индексов нет — clear_collections() дропает коллекции целиком."""
+    say("Creating indexes...")
+    await asyncio.gather(*(db[name].create_indexes(models) for name, models in SEED_INDEXES.items()))
+    say("✓ Indexes created")
 
 # ---------- data creators ----------
-async def create_departments():
-    print("Creating departments...")
-    ts = now_utc()
+async def create_departments(db, ts):
+    say("Creating departments...")
     departments = [
         {
             "id": "dept-gambling",
@@ -124,12 +141,11 @@ async def create_departments():
             "updatedAt": ts,
         },
     ]
-    await db.departments.insert_many(departments)
-    print(f"✓ Created {len(departments)} departments")
+    await db.departments.insert_many(departments, ordered=False)
+    say(f"✓ Created {len(departments)} departments")
 
-async def create_groups():
-    print("Creating groups...")
-    ts = now_utc()
+async def create_groups(db, ts):
+    say("Creating groups...")
     groups = [
         {
             "id": "group-gambling-core",
@@ -166,324 +182,130 @@ async def create_groups():
             "updatedAt": ts,
         },
     ]
-    await db.groups.insert_many(groups)
-    print(f"✓ Created {len(groups)} groups")
+    await db.groups.insert_many(groups, ordered=False)
+    say(f"✓ Created {len(groups)} groups")
 
-async def create_users():
-    print("Creating users...")
-    ts = now_utc()
-    users = [
-        # Главный админ
-        {
-            "id": "admin-001",
-            "email": "admin@company.com",
-            "passwordHash": hash_pw("admin123"),
-            "fullName": "Super Admin",
-            "roles": ["admin"],  # <— массив строк
-            "groups": [],
-            "primary_department_id": "dept-admins",
-            "isActivated": True,
-            "isActive": True,
-            "active": True,
-            "status": "active",
-            "emailVerified": True,
-            "isDisabled": False,
-            "createdAt": ts,
-            "updatedAt": ts,
-        },
+# (id, email, fullName, roles, primary_department_id, group_id)
+USER_SPECS = (
+    # Главный админ
+    ("admin-001", "admin@company.com", "Super Admin", ["admin"], "dept-admins", None),
+    # ====== GAMBLING ======
+    ("user-tech1-gambling", "tech1@gambling.local", "Tech1 Gambling", ["tech"], "dept-gambling", "group-gambling-core"),
+    ("user-tech2-gambling", "tech2@gambling.local", "Tech2 Gambling", ["tech"], "dept-gambling", "group-gambling-core"),
+    ("user-buyertech1-gambling", "buyertech1@gambling.local", "BuyerTech1 Gambling", ["buyer", "tech"], "dept-gambling", "group-gambling-core"),
+    ("user-buyertech2-gambling", "buyertech2@gambling.local", "BuyerTech2 Gambling", ["buyer", "tech"], "dept-gambling", "group-gambling-core"),
+    ("user-designer1-gambling", "designer1@gambling.local", "Designer1 Gambling", ["designer"], "dept-gambling", "group-gambling-core"),
+    ("user-designer2-gambling", "designer2@gambling.local", "Designer2 Gambling", ["designer"], "dept-gambling", "group-gambling-core"),
+    ("user-tl1-gambling", "tl1@gambling.local", "TeamLead1 Gambling", ["team_lead"], "dept-gambling", "group-gambling-core"),
+    ("user-tl2-gambling", "tl2@gambling.local", "TeamLead2 Gambling", ["team_lead"], "dept-gambling", "group-gambling-core"),
+    # ====== SWIP ======
+    ("user-buyer1-swip", "buyer1@swip.local", "Buyer1 SWIP", ["buyer"], "dept-swip", "group-swip-core"),
+    ("user-buyer2-swip", "buyer2@swip.local", "Buyer2 SWIP", ["buyer"], "dept-swip", "group-swip-core"),
+    ("user-tech1-swip", "tech1@swip.local", "Tech1 SWIP", ["tech"], "dept-swip", "group-swip-core"),
+    ("user-tech2-swip", "tech2@swip.local", "Tech2 SWIP", ["tech"], "dept-swip", "group-swip-core"),
+    ("user-designer1-swip", "designer1@swip.local", "Designer1 SWIP", ["designer"], "dept-swip", "group-swip-core"),
+    ("user-designer2-swip", "designer2@swip.local", "Designer2 SWIP", ["designer"], "dept-swip", "group-swip-core"),
+    ("user-tl1-swip", "tl1@swip.local", "TeamLead1 SWIP", ["team_lead"], "dept-swip", "group-swip-core"),
+    ("user-tl2-swip", "tl2@swip.local", "TeamLead2 SWIP", ["team_lead"], "dept-swip", "group-swip-core"),
+)
 
-        # ====== GAMBLING ======
-        {
-            "id": "user-tech1-gambling",
-            "email": "tech1@gambling.local",
-            "passwordHash": hash_pw("f@DOr&hVMLfk"),
-            "fullName": "Tech1 Gambling",
-            "roles": ["tech"],
-            "groups": ["group-gambling-core"],
-            "primary_department_id": "dept-gambling",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-tech2-gambling",
-            "email": "tech2@gambling.local",
-            "passwordHash": hash_pw("tW&hdG4g$yDy"),
-            "fullName": "Tech2 Gambling",
-            "roles": ["tech"],
-            "groups": ["group-gambling-core"],
-            "primary_department_id": "dept-gambling",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-buyertech1-gambling",
-            "email": "buyertech1@gambling.local",
-            "passwordHash": hash_pw("NkHSF&sdwPKq"),
-            "fullName": "BuyerTech1 Gambling",
-            "roles": ["buyer", "tech"],
-            "groups": ["group-gambling-core"],
-            "primary_department_id": "dept-gambling",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-buyertech2-gambling",
-            "email": "buyertech2@gambling.local",
-            "passwordHash": hash_pw("lHq52bN&QHV5"),
-            "fullName": "BuyerTech2 Gambling",
-            "roles": ["buyer", "tech"],
-            "groups": ["group-gambling-core"],
-            "primary_department_id": "dept-gambling",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-designer1-gambling",
-            "email": "designer1@gambling.local",
-            "passwordHash": hash_pw("sC#0ss0WYccc"),
-            "fullName": "Designer1 Gambling",
-            "roles": ["designer"],
-            "groups": ["group-gambling-core"],
-            "primary_department_id": "dept-gambling",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-designer2-gambling",
-            "email": "designer2@gambling.local",
-            "passwordHash": hash_pw("RbxTdBZeqwAB"),
-            "fullName": "Designer2 Gambling",
-            "roles": ["designer"],
-            "groups": ["group-gambling-core"],
-            "primary_department_id": "dept-gambling",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-tl1-gambling",
-            "email": "tl1@gambling.local",
-            "passwordHash": hash_pw("@gNB#X4wYJ8#"),
-            "fullName": "TeamLead1 Gambling",
-            "roles": ["team_lead"],
-            "groups": ["group-gambling-core"],
-            "primary_department_id": "dept-gambling",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-tl2-gambling",
-            "email": "tl2@gambling.local",
-            "passwordHash": hash_pw("LE3qVN1aFkL2"),
-            "fullName": "TeamLead2 Gambling",
-            "roles": ["team_lead"],
-            "groups": ["group-gambling-core"],
-            "primary_department_id": "dept-gambling",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
+def make_user(user_id, email, full_name, roles, department_id, group_id, password_hash, ts):
+    """Активированный юзер; roles — массив строк, groups — [group_id] или []."""
+    return {
+        "id": user_id,
+        "email": email,
+        "passwordHash": password_hash,
+        "fullName": full_name,
+        "roles": list(roles),
+        "groups": [group_id] if group_id else [],
+        "primary_department_id": department_id,
+        "isActivated": True, "isActive": True, "active": True,
+        "status": "active", "emailVerified": True, "isDisabled": False,
+        "createdAt": ts, "updatedAt": ts,
+    }
 
-        # ====== SWIP ======
-        {
-            "id": "user-buyer1-swip",
-            "email": "buyer1@swip.local",
-            "passwordHash": hash_pw("N8of*c1fVtXJ"),
-            "fullName": "Buyer1 SWIP",
-            "roles": ["buyer"],
-            "groups": ["group-swip-core"],
-            "primary_department_id": "dept-swip",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-buyer2-swip",
-            "email": "buyer2@swip.local",
-            "passwordHash": hash_pw("a4ytL%20SSHe"),
-            "fullName": "Buyer2 SWIP",
-            "roles": ["buyer"],
-            "groups": ["group-swip-core"],
-            "primary_department_id": "dept-swip",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-tech1-swip",
-            "email": "tech1@swip.local",
-            "passwordHash": hash_pw("tech1@swip.local"),
-            "fullName": "Tech1 SWIP",
-            "roles": ["tech"],
-            "groups": ["group-swip-core"],
-            "primary_department_id": "dept-swip",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-tech2-swip",
-            "email": "tech2@swip.local",
-            "passwordHash": hash_pw("$h%VNGYbo2sF"),
-            "fullName": "Tech2 SWIP",
-            "roles": ["tech"],
-            "groups": ["group-swip-core"],
-            "primary_department_id": "dept-swip",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-designer1-swip",
-            "email": "designer1@swip.local",
-            "passwordHash": hash_pw("$X!vu6B4PrLb"),
-            "fullName": "Designer1 SWIP",
-            "roles": ["designer"],
-            "groups": ["group-swip-core"],
-            "primary_department_id": "dept-swip",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-designer2-swip",
-            "email": "designer2@swip.local",
-            "passwordHash": hash_pw("0AuKjlC0f7a6"),
-            "fullName": "Designer2 SWIP",
-            "roles": ["designer"],
-            "groups": ["group-swip-core"],
-            "primary_department_id": "dept-swip",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-tl1-swip",
-            "email": "tl1@swip.local",
-            "passwordHash": hash_pw("l8Tm9eQRfp$b"),
-            "fullName": "TeamLead1 SWIP",
-            "roles": ["team_lead"],
-            "groups": ["group-swip-core"],
-            "primary_department_id": "dept-swip",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
-        },
-        {
-            "id": "user-tl2-swip",
-            "email": "tl2@swip.local",
-            "passwordHash": hash_pw("6gStI9Oj#RqO"),
-            "fullName": "TeamLead2 SWIP",
-            "roles": ["team_lead"],
-            "groups": ["group-swip-core"],
-            "primary_department_id": "dept-swip",
-            "isActivated": True, "isActive": True, "active": True,
-            "status": "active", "emailVerified": True, "isDisabled": False,
-            "createdAt": ts, "updatedAt": ts,
+async def create_users(db, ts, hashing):
+    say("Creating users...")
+    hashes = await hashing
+    users = [make_user(*spec, hashes[spec[1]], ts) for spec in USER_SPECS]
+    await db.users.insert_many(users, ordered=False)
+    say(f"✓ Created {len(users)} users")
+
+def make_board(board_id, key, name, department_id, allowed_user_ids, ts):
+    """Доска департамента: видна перечисленным юзерам, владелец — главный админ."""
+    return {
+        "id": board_id,
+        "key": key,
+        "name": name,
+        "type": "tasks",
+        "template": "kanban-basic",
+        "is_archived": False,
+        "settings": {"assignee_enabled": True},
+        "default_department_id": department_id,
+        "visibility": {
+            "department_ids": [department_id],
+            "role_ids": [],
+            "mode": "users",
+            "allowed_group_ids": [],
+            "allowed_user_ids": allowed_user_ids,
+            "permissions": {"read": True, "create": True, "edit": True, "manage": True},
         },
-    ]
-    await db.users.insert_many(users)
-    print(f"✓ Created {len(users)} users")
+        "content_filter": {"by_department": "viewer"},
+        "members": [],
+        "owners": ["admin-001"],
+        "createdAt": ts,
+        "updatedAt": ts,
+    }
 
-async def create_boards_and_columns():
-    print("Creating boards & columns...")
+COLUMN_TEMPLATE = (
+    # (суффикс id, key, name, order)
+    ("todo", "TODO", "Todo", 1),
+    ("doing", "IN_PROGRESS", "In Progress", 2),
+    ("done", "DONE", "Done", 3),
+)
 
-    ts = now_utc()
+async def create_boards_and_columns(db, ts):
+    say("Creating boards & columns...")
     boards = [
-        # Gambling
-        {
-            "id": "board-gambling",
-            "key": "GAM",
-            "name": "Gambling Board",
-            "type": "tasks",
-            "template": "kanban-basic",
-            "is_archived": False,
-            "settings": {"assignee_enabled": True},
-            "default_department_id": "dept-gambling",
-            "visibility": {
-                "department_ids": ["dept-gambling"],
-                "role_ids": [],
-                "mode": "users",
-                "allowed_group_ids": [],
-                "allowed_user_ids": [
-                    "user-tl1-gambling",
-                    "user-tl2-gambling",
-                    "user-tech1-gambling",
-                    "user-tech2-gambling",
-                    "user-buyertech1-gambling",
-                    "user-buyertech2-gambling",
-                    "user-designer1-gambling",
-                    "user-designer2-gambling",
-                    "admin-001",
-                ],
-                "permissions": {"read": True, "create": True, "edit": True, "manage": True},
-            },
-            "content_filter": {"by_department": "viewer"},
-            "members": [],
-            "owners": ["admin-001"],
-            "createdAt": ts,
-            "updatedAt": ts,
-        },
-        # SWIP
-        {
-            "id": "board-swip",
-            "key": "SWP",
-            "name": "SWIP Board",
-            "type": "tasks",
-            "template": "kanban-basic",
-            "is_archived": False,
-            "settings": {"assignee_enabled": True},
-            "default_department_id": "dept-swip",
-            "visibility": {
-                "department_ids": ["dept-swip"],
-                "role_ids": [],
-                "mode": "users",
-                "allowed_group_ids": [],
-                "allowed_user_ids": [
-                    "user-tl1-swip",
-                    "user-tl2-swip",
-                    "user-buyer1-swip",
-                    "user-buyer2-swip",
-                    "user-tech1-swip",
-                    "user-tech2-swip",
-                    "user-designer1-swip",
-                    "user-designer2-swip",
-                    "admin-001",
-                ],
-                "permissions": {"read": True, "create": True, "edit": True, "manage": True},
-            },
-            "content_filter": {"by_department": "viewer"},
-            "members": [],
-            "owners": ["admin-001"],
-            "createdAt": ts,
-            "updatedAt": ts,
-        },
+        make_board("board-gambling", "GAM", "Gambling Board", "dept-gambling", [
+            "user-tl1-gambling",
+            "user-tl2-gambling",
+            "user-tech1-gambling",
+            "user-tech2-gambling",
+            "user-buyertech1-gambling",
+            "user-buyertech2-gambling",
+            "user-designer1-gambling",
+            "user-designer2-gambling",
+            "admin-001",
+        ], ts),
+        make_board("board-swip", "SWP", "SWIP Board", "dept-swip", [
+            "user-tl1-swip",
+            "user-tl2-swip",
+            "user-buyer1-swip",
+            "user-buyer2-swip",
+            "user-tech1-swip",
+            "user-tech2-swip",
+            "user-designer1-swip",
+            "user-designer2-swip",
+            "admin-001",
+        ], ts),
     ]
 
+    # Одинаковый набор колонок на каждой доске
     columns = [
-        # Gambling columns
-        {"id": "col-gam-todo", "board_id": "board-gambling", "key": "TODO", "name": "Todo", "order": 1, "createdAt": ts, "updatedAt": ts},
-        {"id": "col-gam-doing", "board_id": "board-gambling", "key": "IN_PROGRESS", "name": "In Progress", "order": 2, "createdAt": ts, "updatedAt": ts},
-        {"id": "col-gam-done", "board_id": "board-gambling", "key": "DONE", "name": "Done", "order": 3, "createdAt": ts, "updatedAt": ts},
-        # SWIP columns
-        {"id": "col-swp-todo", "board_id": "board-swip", "key": "TODO", "name": "Todo", "order": 1, "createdAt": ts, "updatedAt": ts},
-        {"id": "col-swp-doing", "board_id": "board-swip", "key": "IN_PROGRESS", "name": "In Progress", "order": 2, "createdAt": ts, "updatedAt": ts},
-        {"id": "col-swp-done", "board_id": "board-swip", "key": "DONE", "name": "Done", "order": 3, "createdAt": ts, "updatedAt": ts},
+        {"id": f"col-{prefix}-{slug}", "board_id": board_id, "key": key, "name": name, "order": order, "createdAt": ts, "updatedAt": ts}
+        for board_id, prefix in (("board-gambling", "gam"), ("board-swip", "swp"))
+        for slug, key, name, order in COLUMN_TEMPLATE
     ]
 
-    await db.boards.insert_many(boards)
-    await db.columns.insert_many(columns)
-    print(f"✓ Created {len(boards)} boards, {len(columns)} columns")
+    await asyncio.gather(
+        db.boards.insert_many(boards, ordered=False),
+        db.columns.insert_many(columns, ordered=False),
+    )
+    say(f"✓ Created {len(boards)} boards, {len(columns)} columns")
 
-async def create_tasks():
-    print("Creating tasks...")
-    ts = now_utc()
+async def create_tasks(db, ts):
+    say("Creating tasks...")
     tasks = [
         # Gambling sample tasks
         {
@@ -548,48 +370,62 @@ async def create_tasks():
             "updatedAt": ts,
         },
     ]
-    await db.tasks.insert_many(tasks)
-    print(f"✓ Created {len(tasks)} tasks")
+    await db.tasks.insert_many(tasks, ordered=False)
+    say(f"✓ Created {len(tasks)} tasks")
+
+def say_credentials():
+    """Логины/пароли печатаем только в терминал: в CI/логах контейнера это лишний шум и утечка."""
+    if not sys.stdout.isatty():
+        say("\nLogin credentials not printed (stdout is not a terminal); see SEED_CREDENTIALS in seed_v2.py")
+        return
+    say("\nLogin credentials (plain):")
+    section = None
+    for email, password in SEED_CREDENTIALS.items():
+        domain = email.rsplit("@", 1)[1]
+        if domain.endswith(".local") and domain != section:
+            section = domain
+            say(f"— {domain.removesuffix('.local').upper()} —")
+        say(f"{email} / {password}")
 
 # ---------- main ----------
 async def main():
-    print("🌱 Seeding started...")
+    say("🌱 Seeding started...")
+    # Клиент создаём здесь, а не при импорте: import seed_v2 не открывает соединение с Mongo
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"])
+    db = client[DB_NAME]
+    # bcrypt запускаем сразу, чтобы он считался, пока идут ping, drop и остальные вставки
+    hashing = asyncio.ensure_future(hash_passwords(SEED_CREDENTIALS))
     try:
-        # проверка соединения заранее (чтобы не ждать в середине)
+        # проверка соединения заранее (чтобы не ждать в середине); заодно пул прогревается
+        # до параллельных вставок ниже
         await db.command("ping")
-        await clear_collections()
-        await reset_indexes()
-        await create_departments()
-        await create_groups()
-        await create_users()
-        await create_boards_and_columns()
-        await create_tasks()
-        print("\n✅ Seed completed!")
-        print("\nLogin credentials (plain):")
-        print("Super Admin: admin@company.com / admin123")
-        print("— GAMBLING —")
-        print("tech1@gambling.local / f@DOr&hVMLfk")
-        print("tech2@gambling.local / tW&hdG4g$yDy")
-        print("buyertech1@gambling.local / NkHSF&sdwPKq")
-        print("buyertech2@gambling.local / lHq52bN&QHV5")
-        print("designer1@gambling.local / sC#0ss0WYccc")
-        print("designer2@gambling.local / RbxTdBZeqwAB")
-        print("tl1@gambling.local / @gNB#X4wYJ8#")
-        print("tl2@gambling.local / LE3qVN1aFkL2")
-        print("— SWIP —")
-        print("buyer1@swip.local / N8of*c1fVtXJ")
-        print("buyer2@swip.local / a4ytL%20SSHe")
-        print("tech1@swip.local / tech1@swip.local")
-        print("tech2@swip.local / $h%VNGYbo2sF")
-        print("designer1@swip.local / $X!vu6B4PrLb")
-        print("designer2@swip.local / 0AuKjlC0f7a6")
-        print("tl1@swip.local / l8Tm9eQRfp$b")
-        print("tl2@swip.local / 6gStI9Oj#RqO")
+        await clear_collections(db)
+        # Один момент времени на весь сид: одинаковые createdAt/updatedAt во всех документах
+        ts = now_utc()
+        # Документы ссылаются друг на друга только строковыми id, известными заранее,
+        # поэтому все вставки идут параллельно поверх пула соединений motor
+        await asyncio.gather(
+            create_departments(db, ts),
+            create_groups(db, ts),
+            create_users(db, ts, hashing),
+            create_boards_and_columns(db, ts),
+            create_tasks(db, ts),
+        )
+        await create_indexes(db)
+        say("\n✅ Seed completed!")
+        say_credentials()
     except Exception as e:
-        print(f"❌ Seed failed: {e}")
+        say(f"❌ Seed failed: {e}")
         raise
     finally:
         client.close()
+        flush_out()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # uvloop — необязательная зависимость: если установлен, крутим сид на нём
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
\ No newline at end of file